@@ -16,9 +16,10 @@
 import json
 import os
 import uuid
+from contextlib import contextmanager
 from pathlib import PurePath
 from secrets import token_hex
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, cast
 
 from packaging import version
 from pydantic import BaseModel, Field, ValidationError, validator
@@ -148,6 +149,8 @@ class GlobalConfiguration(BaseModel, metaclass=GlobalConfigMetaClass):
     _config_path: str
     _zen_store: Optional["BaseZenStore"] = None
     _active_project: Optional["ProjectModel"] = None
+    _config_writes_suspended: bool = False
+    _written_config: Optional[Dict[str, Any]] = None
 
     def __init__(
         self, config_path: Optional[str] = None, **kwargs: Any
@@ -241,10 +244,32 @@ class GlobalConfiguration(BaseModel, metaclass=GlobalConfigMetaClass):
             value: The attribute value.
         """
         super().__setattr__(key, value)
-        if key.startswith("_"):
+        if key.startswith("_") or self._config_writes_suspended:
             return
         self._write_config()
 
+    @contextmanager
+    def _batch_config_writes(self) -> Iterator[None]:
+        """Context manager to persist multiple attribute updates at once.
+
+        Attribute updates inside this context are not written to the config
+        file individually. Instead, the global configuration is written once
+        when the (outermost) context is exited.
+
+        Yields:
+            None
+        """
+        if self._config_writes_suspended:
+            yield
+            return
+
+        self._config_writes_suspended = True
+        try:
+            yield
+        finally:
+            self._config_writes_suspended = False
+            self._write_config()
+
     def __custom_getattribute__(self, key: str) -> Any:
         """Gets an attribute value for a specific key.
 
@@ -260,7 +285,9 @@ class GlobalConfiguration(BaseModel, metaclass=GlobalConfigMetaClass):
             The attribute value.
         """
         value = super().__getattribute__(key)
-        if key.startswith("_"):
+        if key.startswith("_") or key not in type(self).__fields__:
+            # Only model fields can be overwritten by environment variables,
+            # so we skip the environment lookup for methods and properties
             return value
 
         environment_variable_name = f"{CONFIG_ENV_VAR_PREFIX}{key.upper()}"
@@ -352,14 +379,19 @@ class GlobalConfiguration(BaseModel, metaclass=GlobalConfigMetaClass):
         """
         config_file = self._config_file(config_path)
         yaml_dict = json.loads(self.json())
-        logger.debug(f"Writing config to {config_file}")
 
         if not fileio.exists(config_file):
             io_utils.create_dir_recursive_if_not_exists(
                 config_path or self.config_directory
             )
+        elif not config_path and yaml_dict == self._written_config:
+            # Nothing changed since we last wrote the config file
+            return
 
+        logger.debug(f"Writing config to {config_file}")
         yaml_utils.write_yaml(config_file, yaml_dict)
+        if not config_path:
+            self._written_config = yaml_dict
 
     def _configure_store(
         self,
@@ -386,24 +418,24 @@ class GlobalConfiguration(BaseModel, metaclass=GlobalConfigMetaClass):
         )
         if self.store != store.config or not self._zen_store:
             logger.debug(f"Configuring the global store to {store.config}")
-            self.store = store.config
-
-            # We want to check if the active user has opted in or out for using
-            # an email address for marketing purposes and if so, record it in
-            # the analytics.
-            active_user = store.active_user
-            if active_user.email_opted_in is not None:
-                self.record_email_opt_in_out(
-                    opted_in=active_user.email_opted_in,
-                    email=active_user.email,
-                    source=AnalyticsEventSource.ZENML_SERVER,
-                )
-
-            self._zen_store = store
-
-            # Sanitize the global configuration to reflect the new store
-            self._sanitize_config()
-            self._write_config()
+            with self._batch_config_writes():
+                self.store = store.config
+
+                # We want to check if the active user has opted in or out for
+                # using an email address for marketing purposes and if so,
+                # record it in the analytics.
+                active_user = store.active_user
+                if active_user.email_opted_in is not None:
+                    self.record_email_opt_in_out(
+                        opted_in=active_user.email_opted_in,
+                        email=active_user.email,
+                        source=AnalyticsEventSource.ZENML_SERVER,
+                    )
+
+                self._zen_store = store
+
+                # Sanitize the global configuration to reflect the new store
+                self._sanitize_config()
 
     def _sanitize_config(self) -> None:
         """Sanitize and save the global configuration.
@@ -14,11 +14,15 @@
 """Implementation of the MLflow experiment tracker for ZenML."""
 
 import os
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, cast
 
 import mlflow
-from mlflow.entities import Experiment, Run
+from mlflow.entities import Run, ViewType
+from mlflow.exceptions import MlflowException
 from mlflow.store.db.db_types import DATABASE_ENGINES
+from mlflow.tracking import MlflowClient
 
 import zenml
 from zenml.artifact_stores import LocalArtifactStore
@@ -53,6 +57,44 @@ DATABRICKS_USERNAME = "DATABRICKS_USERNAME"
 DATABRICKS_PASSWORD = "DATABRICKS_PASSWORD"
 DATABRICKS_TOKEN = "DATABRICKS_TOKEN"
 
+# Maps (tracking URI, experiment name, run name) to the ID of the ZenML
+# MLflow run, so that subsequent steps of a pipeline run can resume the run
+# without searching for it again.
+_RUN_ID_CACHE: Dict[Tuple[str, str, str], str] = {}
+
+# Steps which run concurrently in the same process (e.g. with a
+# multi-threaded orchestrator) would otherwise race to create the MLflow run
+# of their pipeline run, ending up with multiple runs of the same name.
+_RUN_CREATION_LOCK = threading.Lock()
+
+# MLflow clients per tracking URI. Reusing the clients allows them to reuse
+# their connections to remote tracking servers.
+_MLFLOW_CLIENTS: Dict[str, MlflowClient] = {}
+_MLFLOW_CLIENTS_LOCK = threading.Lock()
+
+# Maps (tracking URI, experiment name) to the experiment ID and the time at
+# which it was fetched. Entries expire so that experiments which are deleted
+# and recreated outside of ZenML are eventually picked up again.
+EXPERIMENT_ID_CACHE_TTL_SECONDS = 300
+_EXPERIMENT_ID_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+
+def _quote_filter_value(value: str) -> str:
+    """Quotes a string value for use in an MLflow search filter string.
+
+    MLflow filter strings don't support escaping quotes inside a value, so
+    the value is wrapped in whichever quote character it doesn't contain.
+
+    Args:
+        value: The value to quote.
+
+    Returns:
+        The quoted value.
+    """
+    if '"' in value and "'" not in value:
+        return f"'{value}'"
+    return f'"{value}"'
+
 
 class MLFlowExperimentTracker(BaseExperimentTracker):
     """Track experiments using MLflow."""
@@ -66,6 +108,7 @@ class MLFlowExperimentTracker(BaseExperimentTracker):
         """
         super().__init__(*args, **kwargs)
         self._ensure_valid_tracking_uri()
+        self._local_mlflow_backend_uri: Optional[str] = None
 
     def _ensure_valid_tracking_uri(self) -> None:
         """Ensures that the tracking uri is a valid mlflow tracking uri.
@@ -142,19 +185,24 @@ class MLFlowExperimentTracker(BaseExperimentTracker):
         """
         return MLFlowExperimentTrackerSettings
 
-    @staticmethod
-    def _local_mlflow_backend() -> str:
+    def _local_mlflow_backend(self) -> str:
         """Gets the local MLflow backend inside the ZenML artifact repository directory.
 
+        Looking up the artifact store of the active stack is expensive, so the
+        local MLflow backend is only resolved once per experiment tracker.
+
         Returns:
             The MLflow tracking URI for the local MLflow backend.
         """
-        client = Client(skip_client_check=True)  # type: ignore[call-arg]
-        artifact_store = client.active_stack.artifact_store
-        local_mlflow_backend_uri = os.path.join(artifact_store.path, "mlruns")
-        if not os.path.exists(local_mlflow_backend_uri):
-            os.makedirs(local_mlflow_backend_uri)
-        return "file:" + local_mlflow_backend_uri
+        if self._local_mlflow_backend_uri is None:
+            client = Client(skip_client_check=True)  # type: ignore[call-arg]
+            artifact_store = client.active_stack.artifact_store
+            local_mlflow_backend_uri = os.path.join(
+                artifact_store.path, "mlruns"
+            )
+            os.makedirs(local_mlflow_backend_uri, exist_ok=True)
+            self._local_mlflow_backend_uri = f"file:{local_mlflow_backend_uri}"
+        return self._local_mlflow_backend_uri
 
     def get_tracking_uri(self) -> str:
         """Returns the configured tracking URI or a local fallback.
@@ -170,27 +218,51 @@ class MLFlowExperimentTracker(BaseExperimentTracker):
         Args:
             info: Info about the step that will be executed.
         """
-        self.configure_mlflow()
+        # Resolving the tracking URI might require loading the active stack,
+        # so we only do it once and pass it on from here
+        tracking_uri = self.get_tracking_uri()
+        self._configure_mlflow(tracking_uri)
         settings = cast(
             MLFlowExperimentTrackerSettings,
             self.get_settings(info) or MLFlowExperimentTrackerSettings(),
         )
 
         experiment_name = settings.experiment_name or info.pipeline.name
-        experiment = self._set_active_experiment(experiment_name)
-        run_id = self.get_run_id(
-            experiment_name=experiment_name, run_name=info.run_name
-        )
+        self._set_active_experiment(experiment_name, tracking_uri=tracking_uri)
 
         tags = settings.tags.copy()
         tags.update(self._get_internal_tags())
 
-        mlflow.start_run(
-            run_id=run_id,
-            run_name=info.run_name,
-            experiment_id=experiment.experiment_id,
-            tags=tags,
-        )
+        cache_key = (tracking_uri, experiment_name, info.run_name)
+        with _RUN_CREATION_LOCK:
+            is_cached_run = cache_key in _RUN_ID_CACHE
+            run_id = self._get_run_id(
+                experiment_name=experiment_name,
+                run_name=info.run_name,
+                tracking_uri=tracking_uri,
+            )
+            try:
+                active_run = mlflow.start_run(
+                    run_id=run_id, run_name=info.run_name, tags=tags
+                )
+            except MlflowException:
+                if not is_cached_run:
+                    raise
+
+                # The cached run might have been deleted outside of ZenML,
+                # so we search for the run again
+                _RUN_ID_CACHE.pop(cache_key, None)
+                run_id = self._get_run_id(
+                    experiment_name=experiment_name,
+                    run_name=info.run_name,
+                    tracking_uri=tracking_uri,
+                )
+                active_run = mlflow.start_run(
+                    run_id=run_id, run_name=info.run_name, tags=tags
+                )
+
+            if run_id is None:
+                _RUN_ID_CACHE[cache_key] = active_run.info.run_id
 
         if settings.nested:
             mlflow.start_run(run_name=info.config.name, nested=True, tags=tags)
@@ -206,7 +278,14 @@ class MLFlowExperimentTracker(BaseExperimentTracker):
 
     def configure_mlflow(self) -> None:
         """Configures the MLflow tracking URI and any additional credentials."""
-        tracking_uri = self.get_tracking_uri()
+        self._configure_mlflow(self.get_tracking_uri())
+
+    def _configure_mlflow(self, tracking_uri: str) -> None:
+        """Configures a resolved MLflow tracking URI and additional credentials.
+
+        Args:
+            tracking_uri: The resolved tracking URI.
+        """
         mlflow.set_tracking_uri(tracking_uri)
 
         if is_databricks_tracking_uri(tracking_uri):
@@ -245,13 +324,53 @@ class MLFlowExperimentTracker(BaseExperimentTracker):
         Returns:
             The id of the run if it exists.
         """
-        self.configure_mlflow()
-        experiment_name = self._adjust_experiment_name(experiment_name)
+        tracking_uri = self.get_tracking_uri()
+        self._configure_mlflow(tracking_uri)
+        return self._get_run_id(
+            experiment_name=experiment_name,
+            run_name=run_name,
+            tracking_uri=tracking_uri,
+        )
+
+    def _get_run_id(
+        self, experiment_name: str, run_name: str, tracking_uri: str
+    ) -> Optional[str]:
+        """Gets the id of a run with the given name and experiment.
+
+        Run IDs of ZenML runs are cached per tracking URI, experiment and run
+        name, so that subsequent steps of a pipeline run don't need to search
+        for the run again.
+
+        Args:
+            experiment_name: Name of the experiment in which to search for the
+                run.
+            run_name: Name of the run to search.
+            tracking_uri: The resolved MLflow tracking URI.
+
+        Returns:
+            The id of the run if it exists.
+        """
+        cache_key = (tracking_uri, experiment_name, run_name)
+        if cache_key in _RUN_ID_CACHE:
+            return _RUN_ID_CACHE[cache_key]
+
+        experiment_name = self._adjust_experiment_name(
+            experiment_name, tracking_uri=tracking_uri
+        )
+        experiment_id = self._get_experiment_id(
+            experiment_name, tracking_uri=tracking_uri
+        )
+        if not experiment_id:
+            return None
 
-        runs = mlflow.search_runs(
-            experiment_names=[experiment_name],
-            filter_string=f'tags.mlflow.runName = "{run_name}"',
-            output_format="list",
+        # Query the tracking client directly and only fetch a single active
+        # run, as only the ID of the first matching run is needed here
+        run_name_value = _quote_filter_value(run_name)
+        runs = self._get_client(tracking_uri).search_runs(
+            experiment_ids=[experiment_id],
+            filter_string=f"tags.mlflow.runName = {run_name_value}",
+            run_view_type=ViewType.ACTIVE_ONLY,
+            max_results=1,
         )
 
         if not runs:
@@ -259,34 +378,82 @@ class MLFlowExperimentTracker(BaseExperimentTracker):
 
         run: Run = runs[0]
         if mlflow_utils.is_zenml_run(run):
-            return cast(str, run.info.run_id)
+            run_id = cast(str, run.info.run_id)
+            _RUN_ID_CACHE[cache_key] = run_id
+            return run_id
         else:
             return None
 
-    def _set_active_experiment(self, experiment_name: str) -> Experiment:
+    @staticmethod
+    def _get_client(tracking_uri: str) -> MlflowClient:
+        """Gets the MLflow client for a tracking URI.
+
+        Args:
+            tracking_uri: The resolved MLflow tracking URI.
+
+        Returns:
+            The MLflow client.
+        """
+        with _MLFLOW_CLIENTS_LOCK:
+            if tracking_uri not in _MLFLOW_CLIENTS:
+                _MLFLOW_CLIENTS[tracking_uri] = MlflowClient(
+                    tracking_uri=tracking_uri
+                )
+            return _MLFLOW_CLIENTS[tracking_uri]
+
+    def _set_active_experiment(
+        self, experiment_name: str, tracking_uri: str
+    ) -> None:
         """Sets the active MLflow experiment.
 
         If no experiment with this name exists, it is created and then
-        activated.
+        activated. Runs started without an explicit experiment ID are created
+        in this experiment.
 
         Args:
             experiment_name: Name of the experiment to activate.
+            tracking_uri: The resolved MLflow tracking URI.
+        """
+        experiment_name = self._adjust_experiment_name(
+            experiment_name, tracking_uri=tracking_uri
+        )
+        mlflow.set_experiment(experiment_name=experiment_name)
 
-        Raises:
-            RuntimeError: If the experiment creation or activation failed.
+    def _get_experiment_id(
+        self, experiment_name: str, tracking_uri: str
+    ) -> Optional[str]:
+        """Gets the ID of the MLflow experiment with the given name.
+
+        Experiment IDs are cached for `EXPERIMENT_ID_CACHE_TTL_SECONDS` to
+        avoid fetching the experiment from the tracking server for every step.
+
+        Args:
+            experiment_name: Name of the experiment. This name needs to be
+                adjusted for Databricks already.
+            tracking_uri: The resolved MLflow tracking URI.
 
         Returns:
-            The experiment.
+            The ID of the experiment if it exists.
         """
-        experiment_name = self._adjust_experiment_name(experiment_name)
-
-        mlflow.set_experiment(experiment_name=experiment_name)
-        experiment = mlflow.get_experiment_by_name(experiment_name)
+        cache_key = (tracking_uri, experiment_name)
+        cached_entry = _EXPERIMENT_ID_CACHE.get(cache_key)
+        if cached_entry:
+            experiment_id, fetched_at = cached_entry
+            if time.monotonic() - fetched_at < EXPERIMENT_ID_CACHE_TTL_SECONDS:
+                return experiment_id
+
+        client = self._get_client(tracking_uri)
+        experiment = client.get_experiment_by_name(experiment_name)
         if not experiment:
-            raise RuntimeError("Failed to set active mlflow experiment.")
-        return experiment
+            _EXPERIMENT_ID_CACHE.pop(cache_key, None)
+            return None
 
-    def _adjust_experiment_name(self, experiment_name: str) -> str:
+        experiment_id = cast(str, experiment.experiment_id)
+        _EXPERIMENT_ID_CACHE[cache_key] = (experiment_id, time.monotonic())
+        return experiment_id
+
+    @staticmethod
+    def _adjust_experiment_name(experiment_name: str, tracking_uri: str) -> str:
         """Prepends a slash to the experiment name if using Databricks.
 
         Databricks requires the experiment name to be an absolute path within
@@ -294,12 +461,11 @@ class MLFlowExperimentTracker(BaseExperimentTracker):
 
         Args:
             experiment_name: The experiment name.
+            tracking_uri: The resolved MLflow tracking URI.
 
         Returns:
             The potentially adjusted experiment name.
         """
-        tracking_uri = self.get_tracking_uri()
-
         if (
             tracking_uri
             and is_databricks_tracking_uri(tracking_uri)
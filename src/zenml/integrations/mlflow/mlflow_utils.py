@@ -13,12 +13,14 @@
 #  permissions and limitations under the License.
 """Implementation of utils specific to the MLflow integration."""
 
-import mlflow
-from mlflow.entities import Run
+from typing import TYPE_CHECKING
 
 from zenml.client import Client
 from zenml.logger import get_logger
 
+if TYPE_CHECKING:
+    from mlflow.entities import Run
+
 logger = get_logger(__name__)
 
 ZENML_TAG_KEY = "zenml"
@@ -61,7 +63,7 @@ def get_tracking_uri() -> str:
     return tracker.get_tracking_uri()
 
 
-def is_zenml_run(run: Run) -> bool:
+def is_zenml_run(run: "Run") -> bool:
     """Checks if a MLflow run is a ZenML run or not.
 
     Args:
@@ -79,6 +81,8 @@ def stop_zenml_mlflow_runs() -> None:
     This function stops all MLflow active runs until no active run exists or
     a non-ZenML run is active.
     """
+    import mlflow
+
     active_run = mlflow.active_run()
     while active_run:
         if is_zenml_run(active_run):
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of a registry to track ZenML integrations."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
 
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
@@ -30,6 +30,7 @@ class IntegrationRegistry(object):
     def __init__(self) -> None:
         """Initializing the integration registry."""
         self._integrations: Dict[str, Type["Integration"]] = {}
+        self._activated_integrations: Set[str] = set()
 
     @property
     def integrations(self) -> Dict[str, Type["Integration"]]:
@@ -69,10 +70,18 @@ class IntegrationRegistry(object):
         self._integrations[key] = type_
 
     def activate_integrations(self) -> None:
-        """Method to activate the integrations with are registered in the registry."""
+        """Method to activate the integrations with are registered in the registry.
+
+        Integrations which were already activated by a previous call are
+        skipped, so calling this method repeatedly is cheap.
+        """
         for name, integration in self._integrations.items():
+            if name in self._activated_integrations:
+                continue
+
             if integration.check_installation():
                 integration.activate()
+                self._activated_integrations.add(name)
                 logger.debug(f"Integration `{name}` is activated.")
             else:
                 logger.debug(f"Integration `{name}` could not be activated.")
@@ -127,6 +127,7 @@ class BaseStepMeta(type):
         cls.PARAMETERS_FUNCTION_PARAMETER_NAME = None
         cls.PARAMETERS_CLASS = None
         cls.CONTEXT_PARAMETER_NAME = None
+        cls.CONTEXT_CLASS = None
 
         # Get the signature of the step function
         step_function_signature = inspect.getfullargspec(
@@ -194,6 +195,7 @@ class BaseStepMeta(type):
                         f"argument for a step."
                     )
                 cls.CONTEXT_PARAMETER_NAME = arg
+                cls.CONTEXT_CLASS = arg_type
             else:
                 # Can't do any check for existing materializers right now
                 # as they might get be defined later, so we simply store the
@@ -252,6 +254,7 @@ class BaseStep(metaclass=BaseStepMeta):
     PARAMETERS_FUNCTION_PARAMETER_NAME: ClassVar[Optional[str]] = None
     PARAMETERS_CLASS: ClassVar[Optional[Type["BaseParameters"]]] = None
     CONTEXT_PARAMETER_NAME: ClassVar[Optional[str]] = None
+    CONTEXT_CLASS: ClassVar[Optional[Type[StepContext]]] = None
 
     INSTANCE_CONFIGURATION: Dict[str, Any] = {}
 
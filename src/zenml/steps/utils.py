@@ -57,7 +57,6 @@ from zenml.exceptions import MissingStepParameterError, StepInterfaceError
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.steps.step_context import StepContext
 from zenml.steps.step_environment import StepEnvironment
 from zenml.steps.step_output import Output
 from zenml.utils import proto_utils, source_utils
@@ -118,7 +117,6 @@ def parse_return_type_annotations(
     """Parse the returns of a step function into a dict of resolved types.
 
     Called within `BaseStepMeta.__new__()` to define `cls.OUTPUT_SIGNATURE`.
-    Called within `Do()` to resolve type annotations.
 
     Args:
         step_annotations: Type annotations of the step function.
@@ -241,6 +239,16 @@ def create_executor_class(
         The executor class.
     """
     executor_class_name = _get_executor_class_name(step.configuration.name)
+    module = sys.modules[__name__]
+
+    # Reuse the executor class if it was already created for this step
+    existing_executor_class = getattr(module, executor_class_name, None)
+    if (
+        existing_executor_class is not None
+        and existing_executor_class._STEP is step
+    ):
+        return cast(Type[_ZenMLStepExecutor], existing_executor_class)
+
     executor_class = type(
         executor_class_name,
         (_ZenMLStepExecutor,),
@@ -248,7 +256,6 @@ def create_executor_class(
     )
 
     # Add the executor class to the current module, so tfx can load it
-    module = sys.modules[__name__]
     setattr(module, executor_class_name, executor_class)
 
     return executor_class
@@ -280,20 +287,57 @@ def _get_executor_class_name(step_name: str) -> str:
     return f"{step_name}_Executor"
 
 
+def _get_single_artifacts(
+    artifacts: Mapping[str, Sequence[BaseArtifact]]
+) -> Dict[str, BaseArtifact]:
+    """Gets the single artifact of each TFX input or output channel.
+
+    Args:
+        artifacts: Mapping of channel names to the artifacts of the channel.
+
+    Returns:
+        Dictionary mapping channel names to the artifact of the channel.
+
+    Raises:
+        RuntimeError: If a channel does not contain exactly one artifact.
+    """
+    if all(len(channel) == 1 for channel in artifacts.values()):
+        return {name: channel[0] for name, channel in artifacts.items()}
+
+    invalid_channels = {
+        name: len(channel)
+        for name, channel in artifacts.items()
+        if len(channel) != 1
+    }
+    raise RuntimeError(
+        f"Expected exactly one artifact per step input and output, but got "
+        f"the following artifact counts: {invalid_channels}."
+    )
+
+
 class _ZenMLStepExecutor(BaseExecutor):
     """TFX Executor which runs ZenML steps."""
 
     if TYPE_CHECKING:
         _STEP: ClassVar["BaseStep"]
 
+    _configuration: Optional[StepConfiguration] = None
+
     @property
     def configuration(self) -> StepConfiguration:
         """Configuration of the step to execute.
 
+        The configuration is only parsed and validated on first access, as
+        it's used repeatedly while executing the step.
+
         Returns:
             The step configuration.
         """
-        return StepConfiguration.parse_obj(self._STEP.configuration)
+        if self._configuration is None:
+            self._configuration = StepConfiguration.parse_obj(
+                self._STEP.configuration
+            )
+        return self._configuration
 
     def _load_output_materializers(self) -> Dict[str, Type[BaseMaterializer]]:
         """Loads the output materializers for the step.
@@ -374,65 +418,70 @@ class _ZenMLStepExecutor(BaseExecutor):
 
         Raises:
             MissingStepParameterError: if a required parameter is missing.
-            RuntimeError: if the step fails.
+            RuntimeError: if the step fails or an input or output channel
+                does not contain exactly one artifact.
             StepInterfaceError: if the step interface is not implemented.
         """
-        from zenml.steps import BaseParameters
-
         step_name = self.configuration.name
         step_function = self._STEP.entrypoint
         output_materializers = self._load_output_materializers()
 
-        # remove all ZenML internal execution properties
-        exec_properties = {
-            k: json.loads(v)
-            for k, v in exec_properties.items()
-            if not k.startswith(INTERNAL_EXECUTION_PARAMETER_PREFIX)
-        }
+        # TFX passes a list of artifacts per channel, but ZenML steps always
+        # consume and produce exactly one artifact per input/output
+        input_artifacts = _get_single_artifacts(input_dict)
+        output_artifacts = _get_single_artifacts(output_dict)
 
         # Building the args for the entrypoint function
         function_params = {}
 
-        # First, we parse the inputs, i.e., params and input artifacts.
-        spec = inspect.getfullargspec(inspect.unwrap(step_function))
-        args = spec.args
-
-        if args and args[0] == "self":
-            args.pop(0)
-
-        for arg in args:
-            arg_type = spec.annotations.get(arg, None)
-            arg_type = resolve_type_annotation(arg_type)
-
-            if issubclass(arg_type, BaseParameters):
-                try:
-                    config_object = arg_type.parse_obj(exec_properties)
-                except pydantic.ValidationError as e:
-                    missing_fields = [
-                        str(field)
-                        for error_dict in e.errors()
-                        for field in error_dict["loc"]
-                    ]
-
-                    raise MissingStepParameterError(
-                        step_name,
-                        missing_fields,
-                        arg_type,
-                    ) from None
-                function_params[arg] = config_object
-            elif issubclass(arg_type, StepContext):
-                output_artifacts = {k: v[0] for k, v in output_dict.items()}
-                context = arg_type(
-                    step_name=step_name,
-                    output_materializers=output_materializers,
-                    output_artifacts=output_artifacts,
-                )
-                function_params[arg] = context
-            else:
-                # At this point, it has to be an artifact, so we resolve
-                function_params[arg] = self._load_input_artifact(
-                    input_dict[arg][0], arg_type
-                )
+        # First, we parse the inputs, i.e., params and input artifacts. The
+        # step class already classified its entrypoint arguments when it was
+        # created, so we don't need to inspect the entrypoint again here.
+        parameters_class = self._STEP.PARAMETERS_CLASS
+        parameters_arg = self._STEP.PARAMETERS_FUNCTION_PARAMETER_NAME
+        if parameters_class and parameters_arg:
+            # Only decode the execution properties which are fields of the
+            # parameters class, this skips all ZenML internal execution
+            # properties. Parameters are stored by field name, but we accept
+            # aliases as well.
+            parameter_names = set(parameters_class.__fields__)
+            parameter_names.update(
+                field.alias for field in parameters_class.__fields__.values()
+            )
+            parameters = {
+                k: json.loads(v)
+                for k, v in exec_properties.items()
+                if k in parameter_names
+            }
+            try:
+                config_object = parameters_class.parse_obj(parameters)
+            except pydantic.ValidationError as e:
+                missing_fields = [
+                    str(field)
+                    for error_dict in e.errors()
+                    for field in error_dict["loc"]
+                ]
+
+                raise MissingStepParameterError(
+                    step_name,
+                    missing_fields,
+                    parameters_class,
+                ) from None
+            function_params[parameters_arg] = config_object
+
+        context_class = self._STEP.CONTEXT_CLASS
+        context_arg = self._STEP.CONTEXT_PARAMETER_NAME
+        if context_class and context_arg:
+            function_params[context_arg] = context_class(
+                step_name=step_name,
+                output_materializers=output_materializers,
+                output_artifacts=output_artifacts,
+            )
+
+        for arg, arg_type in self._STEP.INPUT_SIGNATURE.items():
+            function_params[arg] = self._load_input_artifact(
+                input_artifacts[arg], arg_type
+            )
 
         if self._context is None:
             raise RuntimeError(
@@ -461,7 +510,7 @@ class _ZenMLStepExecutor(BaseExecutor):
         ):
             return_values = step_function(**function_params)
 
-        output_annotations = parse_return_type_annotations(spec.annotations)
+        output_annotations = self._STEP.OUTPUT_SIGNATURE
         if len(output_annotations) > 0:
             # if there is only one output annotation (either directly specified
             # or contained in an `Output` tuple) we treat the step function
@@ -487,6 +536,7 @@ class _ZenMLStepExecutor(BaseExecutor):
                     f"(return values: {return_values})."
                 )
 
+            output_configurations = self.configuration.outputs
             for return_value, (output_name, output_type) in zip(
                 return_values, output_annotations.items()
             ):
@@ -498,14 +548,14 @@ class _ZenMLStepExecutor(BaseExecutor):
                     )
 
                 materializer_class = output_materializers[output_name]
-                materializer_source = self.configuration.outputs[
+                materializer_source = output_configurations[
                     output_name
                 ].materializer_source
 
                 self._store_output_artifact(
                     materializer_class=materializer_class,
                     materializer_source=materializer_source,
-                    artifact=output_dict[output_name][0],
+                    artifact=output_artifacts[output_name],
                     data=return_value,
                 )
 
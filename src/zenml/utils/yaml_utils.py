@@ -23,6 +23,15 @@ import yaml
 from zenml.io import fileio
 from zenml.utils import io_utils
 
+try:
+    # Use the LibYAML based emitter if PyYAML was built with it, it's
+    # considerably faster than the pure Python implementation. Note that the
+    # formatting of the written files can differ slightly (e.g. long quoted
+    # strings get folded at different points), but they load to the same data
+    from yaml import CDumper as Dumper
+except ImportError:
+    from yaml import Dumper  # type: ignore[misc]
+
 
 def write_yaml(
     file_path: str, contents: Dict[Any, Any], sort_keys: bool = True
@@ -44,7 +53,7 @@ def write_yaml(
         if not fileio.isdir(dir_):
             raise FileNotFoundError(f"Directory {dir_} does not exist.")
     io_utils.write_file_contents_as_string(
-        file_path, yaml.dump(contents, sort_keys=sort_keys)
+        file_path, yaml.dump(contents, Dumper=Dumper, sort_keys=sort_keys)
     )
 
 
@@ -64,7 +73,9 @@ def append_yaml(file_path: str, contents: Dict[Any, Any]) -> None:
         dir_ = str(Path(file_path).parent)
         if not fileio.isdir(dir_):
             raise FileNotFoundError(f"Directory {dir_} does not exist.")
-    io_utils.write_file_contents_as_string(file_path, yaml.dump(file_contents))
+    io_utils.write_file_contents_as_string(
+        file_path, yaml.dump(file_contents, Dumper=Dumper)
+    )
 
 
 def read_yaml(file_path: str) -> Any:
@@ -18,6 +18,7 @@ import pytest
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.io import fileio
+from zenml.utils import yaml_utils
 
 
 def test_global_config_file_creation(clean_client):
@@ -48,3 +49,44 @@ def test_global_config_returns_value_from_environment_variable(
 
     os.environ["ZENML_ANALYTICS_OPT_IN"] = "false"
     assert config.analytics_opt_in is False
+
+
+def test_global_config_batches_config_writes(mocker, clean_client):
+    """Tests that attribute updates inside a batch context are written to the
+    config file only once."""
+    config = GlobalConfiguration()
+    mock_write_config = mocker.patch.object(
+        GlobalConfiguration, "_write_config"
+    )
+
+    with config._batch_config_writes():
+        config.user_email = "zenml@zenml.io"
+        config.user_email_opt_in = True
+        assert mock_write_config.call_count == 0
+
+    assert mock_write_config.call_count == 1
+    assert config.user_email == "zenml@zenml.io"
+
+    config.user_email_opt_in = False
+    assert mock_write_config.call_count == 2
+
+
+def test_global_config_skips_unchanged_config_writes(mocker, clean_client):
+    """Tests that the config file is only rewritten if the configuration
+    changed since it was last written or the file doesn't exist anymore."""
+    config = GlobalConfiguration()
+    config.user_email = "zenml@zenml.io"
+
+    write_yaml = mocker.spy(yaml_utils, "write_yaml")
+
+    config.user_email = "zenml@zenml.io"
+    assert write_yaml.call_count == 0
+
+    fileio.remove(config._config_file())
+    config.user_email = "zenml@zenml.io"
+    assert write_yaml.call_count == 1
+    assert fileio.exists(config._config_file())
+    assert (
+        yaml_utils.read_yaml(config._config_file())["user_email"]
+        == "zenml@zenml.io"
+    )
@@ -15,10 +15,13 @@
 import os
 from contextlib import ExitStack as does_not_raise
 from datetime import datetime
+from typing import Any, Dict
 from uuid import uuid4
 
 import pytest
+from mlflow.exceptions import MlflowException
 from pydantic import ValidationError
+from pytest_mock import MockerFixture
 
 from zenml.artifact_stores import LocalArtifactStore, LocalArtifactStoreConfig
 from zenml.enums import StackComponentType
@@ -27,6 +30,9 @@ from zenml.integrations.gcp.artifact_stores import GCPArtifactStore
 from zenml.integrations.gcp.flavors.gcp_artifact_store_flavor import (
     GCPArtifactStoreConfig,
 )
+from zenml.integrations.mlflow.experiment_trackers import (
+    mlflow_experiment_tracker,
+)
 from zenml.integrations.mlflow.experiment_trackers.mlflow_experiment_tracker import (
     DATABRICKS_HOST,
     DATABRICKS_PASSWORD,
@@ -40,7 +46,9 @@ from zenml.integrations.mlflow.experiment_trackers.mlflow_experiment_tracker imp
 )
 from zenml.integrations.mlflow.flavors.mlflow_experiment_tracker_flavor import (
     MLFlowExperimentTrackerConfig,
+    MLFlowExperimentTrackerSettings,
 )
+from zenml.integrations.mlflow.mlflow_utils import ZENML_TAG_KEY
 from zenml.orchestrators import LocalOrchestrator
 from zenml.stack import Stack
 from zenml.stack.stack_component import StackComponentConfig
@@ -299,3 +307,192 @@ def test_mlflow_experiment_tracker_set_config(local_stack: Stack) -> None:
     assert os.environ[DATABRICKS_PASSWORD] == "password"
     assert os.environ[DATABRICKS_TOKEN] == "token1234"
     assert os.environ[DATABRICKS_HOST] == "https://databricks.com"
+
+
+def _get_remote_mlflow_experiment_tracker() -> MLFlowExperimentTracker:
+    """Creates an MLflow experiment tracker with a remote tracking URI."""
+    return MLFlowExperimentTracker(
+        name="",
+        id=uuid4(),
+        config=MLFlowExperimentTrackerConfig(
+            tracking_uri="http://localhost:5000",
+            tracking_token="token1234",
+        ),
+        flavor="mlflow",
+        type=StackComponentType.EXPERIMENT_TRACKER,
+        user=uuid4(),
+        project=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+
+def test_mlflow_experiment_tracker_caches_experiment_ids(
+    mocker: MockerFixture,
+) -> None:
+    """Tests that the MLflow experiment tracker caches experiment IDs until
+    the cache entry expires."""
+    experiment_tracker = _get_remote_mlflow_experiment_tracker()
+    mocker.patch.dict(
+        mlflow_experiment_tracker._EXPERIMENT_ID_CACHE, clear=True
+    )
+    mocker.patch.dict(mlflow_experiment_tracker._MLFLOW_CLIENTS, clear=True)
+    mock_client = mocker.patch.object(mlflow_experiment_tracker, "MlflowClient")
+    get_experiment = mock_client.return_value.get_experiment_by_name
+    get_experiment.return_value.experiment_id = "42"
+
+    def get_experiment_id() -> str:
+        return experiment_tracker._get_experiment_id(
+            "experiment", tracking_uri="http://localhost:5000"
+        )
+
+    assert get_experiment_id() == "42"
+    assert get_experiment_id() == "42"
+    assert get_experiment.call_count == 1
+
+    # let the cache entry expire
+    cache_key = ("http://localhost:5000", "experiment")
+    experiment_id, fetched_at = mlflow_experiment_tracker._EXPERIMENT_ID_CACHE[
+        cache_key
+    ]
+    mlflow_experiment_tracker._EXPERIMENT_ID_CACHE[cache_key] = (
+        experiment_id,
+        fetched_at - mlflow_experiment_tracker.EXPERIMENT_ID_CACHE_TTL_SECONDS,
+    )
+    get_experiment.return_value.experiment_id = "43"
+    assert get_experiment_id() == "43"
+    assert get_experiment.call_count == 2
+    # the MLflow client for the tracking URI is reused
+    assert mock_client.call_count == 1
+
+
+def _mock_mlflow_run_search(mocker: MockerFixture, tags: Dict[str, Any]):
+    """Mocks the MLflow client to find a single run with the given tags.
+
+    Returns:
+        The mocked `search_runs` method of the MLflow client.
+    """
+    mocker.patch.dict(mlflow_experiment_tracker._RUN_ID_CACHE, clear=True)
+    mocker.patch.object(MLFlowExperimentTracker, "_configure_mlflow")
+    mocker.patch.object(
+        MLFlowExperimentTracker, "_get_experiment_id", return_value="1"
+    )
+    mock_get_client = mocker.patch.object(
+        MLFlowExperimentTracker, "_get_client"
+    )
+    run = mocker.MagicMock()
+    run.info.run_id = "existing_run_id"
+    run.data.tags = tags
+    search_runs = mock_get_client.return_value.search_runs
+    search_runs.return_value = [run]
+    return search_runs
+
+
+def test_mlflow_experiment_tracker_caches_zenml_run_ids(
+    mocker: MockerFixture,
+) -> None:
+    """Tests that the MLflow experiment tracker only searches for a ZenML run
+    once per tracking URI, experiment and run name."""
+    experiment_tracker = _get_remote_mlflow_experiment_tracker()
+    search_runs = _mock_mlflow_run_search(mocker, tags={ZENML_TAG_KEY: "0"})
+
+    for _ in range(2):
+        run_id = experiment_tracker.get_run_id(
+            experiment_name="experiment", run_name="run"
+        )
+        assert run_id == "existing_run_id"
+    assert search_runs.call_count == 1
+
+    experiment_tracker.get_run_id(
+        experiment_name="experiment", run_name="other_run"
+    )
+    assert search_runs.call_count == 2
+
+
+def test_mlflow_experiment_tracker_does_not_cache_non_zenml_runs(
+    mocker: MockerFixture,
+) -> None:
+    """Tests that the MLflow experiment tracker doesn't cache the IDs of runs
+    which weren't created by ZenML."""
+    experiment_tracker = _get_remote_mlflow_experiment_tracker()
+    search_runs = _mock_mlflow_run_search(mocker, tags={})
+
+    for _ in range(2):
+        run_id = experiment_tracker.get_run_id(
+            experiment_name="experiment", run_name="run"
+        )
+        assert run_id is None
+    assert search_runs.call_count == 2
+    assert not mlflow_experiment_tracker._RUN_ID_CACHE
+
+
+def test_mlflow_experiment_tracker_caches_created_run_ids(
+    mocker: MockerFixture,
+) -> None:
+    """Tests that the ID of a run created when preparing a step run is cached
+    for subsequent steps."""
+    experiment_tracker = _get_remote_mlflow_experiment_tracker()
+    search_runs = _mock_mlflow_run_search(mocker, tags={})
+    search_runs.return_value = []
+    mocker.patch.object(
+        MLFlowExperimentTracker,
+        "get_settings",
+        return_value=MLFlowExperimentTrackerSettings(),
+    )
+    mocker.patch.object(MLFlowExperimentTracker, "_set_active_experiment")
+    mock_start_run = mocker.patch.object(
+        mlflow_experiment_tracker.mlflow, "start_run"
+    )
+    mock_start_run.return_value.info.run_id = "new_run_id"
+
+    info = mocker.MagicMock(run_name="run")
+    info.pipeline.name = "pipeline"
+    experiment_tracker.prepare_step_run(info)
+    assert search_runs.call_count == 1
+    assert mock_start_run.call_args.kwargs["run_id"] is None
+
+    run_id = experiment_tracker.get_run_id(
+        experiment_name="pipeline", run_name="run"
+    )
+    assert run_id == "new_run_id"
+    assert search_runs.call_count == 1
+
+    experiment_tracker.prepare_step_run(info)
+    assert search_runs.call_count == 1
+    assert mock_start_run.call_args.kwargs["run_id"] == "new_run_id"
+
+
+def test_mlflow_experiment_tracker_searches_again_if_cached_run_is_gone(
+    mocker: MockerFixture,
+) -> None:
+    """Tests that the MLflow experiment tracker drops a cached run ID and
+    searches for the run again if the cached run can't be started."""
+    experiment_tracker = _get_remote_mlflow_experiment_tracker()
+    search_runs = _mock_mlflow_run_search(mocker, tags={})
+    search_runs.return_value = []
+    mocker.patch.object(
+        MLFlowExperimentTracker,
+        "get_settings",
+        return_value=MLFlowExperimentTrackerSettings(),
+    )
+    mocker.patch.object(MLFlowExperimentTracker, "_set_active_experiment")
+    new_run = mocker.MagicMock()
+    new_run.info.run_id = "new_run_id"
+    mock_start_run = mocker.patch.object(
+        mlflow_experiment_tracker.mlflow,
+        "start_run",
+        side_effect=[MlflowException("Run not found."), new_run],
+    )
+
+    cache_key = ("http://localhost:5000", "pipeline", "run")
+    mlflow_experiment_tracker._RUN_ID_CACHE[cache_key] = "deleted_run_id"
+
+    info = mocker.MagicMock(run_name="run")
+    info.pipeline.name = "pipeline"
+    experiment_tracker.prepare_step_run(info)
+
+    assert mock_start_run.call_count == 2
+    assert mock_start_run.call_args_list[0].kwargs["run_id"] == "deleted_run_id"
+    assert mock_start_run.call_args_list[1].kwargs["run_id"] is None
+    assert search_runs.call_count == 1
+    assert mlflow_experiment_tracker._RUN_ID_CACHE[cache_key] == "new_run_id"
@@ -0,0 +1,56 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from pytest_mock import MockerFixture
+
+from zenml.integrations.registry import IntegrationRegistry
+
+
+def test_registry_activates_integrations_only_once(
+    mocker: MockerFixture,
+) -> None:
+    """Tests that activating the integrations multiple times only activates
+    each installed integration once."""
+    registry = IntegrationRegistry()
+    integration = mocker.MagicMock()
+    integration.check_installation.return_value = True
+    registry.register_integration("integration", integration)
+
+    registry.activate_integrations()
+    registry.activate_integrations()
+
+    assert integration.activate.call_count == 1
+    assert integration.check_installation.call_count == 1
+
+
+def test_registry_retries_activating_integrations_which_are_not_installed(
+    mocker: MockerFixture,
+) -> None:
+    """Tests that integrations which weren't installed when activating the
+    integrations are checked and activated again in later calls."""
+    registry = IntegrationRegistry()
+    integration = mocker.MagicMock()
+    integration.check_installation.return_value = False
+    registry.register_integration("integration", integration)
+
+    registry.activate_integrations()
+    assert integration.activate.call_count == 0
+
+    integration.check_installation.return_value = True
+    registry.activate_integrations()
+    assert integration.check_installation.call_count == 2
+    assert integration.activate.call_count == 1
+
+    registry.activate_integrations()
+    assert integration.activate.call_count == 1
@@ -15,6 +15,7 @@ from contextlib import ExitStack as does_not_raise
 from typing import Dict, List, Optional
 
 import pytest
+from pydantic import Field
 
 from zenml.artifacts import DataArtifact, ModelArtifact
 from zenml.environment import Environment
@@ -975,3 +976,34 @@ def test_upstream_step_computation():
     assert s1.upstream_steps == {"step_2"}
     assert not s2.upstream_steps
     assert s3.upstream_steps == {"step_1", "step_2"}
+
+
+def test_step_parameters_with_aliased_fields(one_step_pipeline):
+    """Tests that parameters with an aliased field are passed to the step by
+    their field name."""
+
+    class ParamsWithAlias(BaseParameters):
+        x: int = Field(1, alias="X")
+
+        class Config:
+            allow_population_by_field_name = True
+
+    @step
+    def some_step(params: ParamsWithAlias) -> None:
+        assert params.x == 5
+
+    one_step_pipeline(some_step(params=ParamsWithAlias(x=5))).run()
+
+
+def test_step_context_subclass_is_passed_to_step(one_step_pipeline):
+    """Tests that a step annotated with a `StepContext` subclass receives an
+    instance of that subclass."""
+
+    class CustomStepContext(StepContext):
+        pass
+
+    @step
+    def some_step(context: CustomStepContext) -> None:
+        assert isinstance(context, CustomStepContext)
+
+    one_step_pipeline(some_step()).run()
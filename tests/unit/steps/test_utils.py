@@ -13,9 +13,17 @@
 #  permissions and limitations under the License.
 from typing import Dict, List, Set
 
+import pytest
 from numpy import ndarray
 
-from zenml.steps.utils import resolve_type_annotation
+from zenml.artifacts import DataArtifact
+from zenml.steps import step
+from zenml.steps.utils import (
+    _get_single_artifacts,
+    create_executor_class,
+    get_executor_class,
+    resolve_type_annotation,
+)
 
 
 def test_type_annotation_resolving():
@@ -26,3 +34,50 @@ def test_type_annotation_resolving():
 
     assert resolve_type_annotation(set) is set
     assert resolve_type_annotation(ndarray) is ndarray
+
+
+def test_getting_single_artifacts_of_channels():
+    """Tests that the single artifact of each channel is returned and that
+    channels with zero or multiple artifacts raise an error."""
+    first_artifact = DataArtifact()
+    second_artifact = DataArtifact()
+
+    assert _get_single_artifacts({}) == {}
+    assert _get_single_artifacts(
+        {"first": [first_artifact], "second": [second_artifact]}
+    ) == {"first": first_artifact, "second": second_artifact}
+
+    with pytest.raises(RuntimeError):
+        _get_single_artifacts({"first": []})
+
+    with pytest.raises(RuntimeError):
+        _get_single_artifacts({"first": [first_artifact, second_artifact]})
+
+
+def test_executor_class_is_reused_for_the_same_step():
+    """Tests that the executor class of a step is only reused when it was
+    created for the same step instance."""
+
+    @step
+    def some_step() -> None:
+        pass
+
+    step_instance = some_step()
+    executor_class = create_executor_class(step_instance)
+
+    assert create_executor_class(step_instance) is executor_class
+    assert executor_class._STEP is step_instance
+
+    other_step_instance = some_step()
+    assert (
+        other_step_instance.configuration.name
+        == step_instance.configuration.name
+    )
+
+    other_executor_class = create_executor_class(other_step_instance)
+    assert other_executor_class is not executor_class
+    assert other_executor_class._STEP is other_step_instance
+    assert (
+        get_executor_class(step_instance.configuration.name)
+        is other_executor_class
+    )
@@ -17,6 +17,7 @@ import string
 from contextlib import ExitStack as does_not_raise
 from datetime import datetime
 from typing import Optional
+from unittest.mock import PropertyMock
 from uuid import uuid4
 
 import pytest
@@ -204,6 +205,7 @@ def test_creating_repository_instance_during_step_execution(mocker):
     does not fail."""
     mocker.patch(
         "zenml.environment.Environment.step_is_running",
+        new_callable=PropertyMock,
         return_value=True,
     )
     with does_not_raise():